@@ -17,7 +17,7 @@ Environment Variables:
 
 __version__ = "0.1.2"
 
-from .ai_providers import AIProvider, LocalAIProvider, configure_provider, get_provider
+from .ai_providers import AIProvider, AsyncLocalAIProvider, LocalAIProvider, configure_provider, get_provider
 from .auto_correct import (
     SelectorAutoCorrect,
     configure_auto_correct,
@@ -31,7 +31,7 @@ from .correction_tracker import (
     get_correction_tracker,
     record_correction,
 )
-from .wait_hook import install_auto_correct_hook, uninstall_auto_correct_hook
+from .wait_hook import AutoCorrectWebDriverWait, install_auto_correct_hook, uninstall_auto_correct_hook
 
 __all__ = [
     "__version__",
@@ -45,9 +45,11 @@ __all__ = [
     "apply_corrections_to_test_files",
     "export_corrections_report",
     "AIProvider",
+    "AsyncLocalAIProvider",
     "LocalAIProvider",
     "get_provider",
     "configure_provider",
+    "AutoCorrectWebDriverWait",
     "install_auto_correct_hook",
     "uninstall_auto_correct_hook",
 ]
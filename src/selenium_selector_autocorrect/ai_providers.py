@@ -1,38 +1,178 @@
 """AI provider for selector auto-correction using local AI service."""
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol, Tuple, cast, runtime_checkable
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional speedup: orjson parses the multi-KB chat responses several
+    # times faster than stdlib json. Install via the [speedups] extra.
+    import orjson
 
-class AIProvider(ABC):
-    """Abstract base class for AI providers."""
+    def _json_loads(data: "bytes | str") -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: "bytes | str") -> Any:
+        return json.loads(data)
+
+# Maximum number of exact-match prompt responses kept per provider instance.
+_RESPONSE_CACHE_SIZE = 256
+
+# Maximum number of page-context fingerprint entries kept per provider instance.
+_CONTEXT_CACHE_SIZE = 128
+
+# Marker separating the failure description from the DOM context in prompts
+# built by SelectorAutoCorrect.suggest_selector.
+_CONTEXT_MARKER = "Available Elements:"
+
+_STRATEGY_LINE = re.compile(r"^- Strategy:\s*(.+)$", re.MULTILINE)
+
+# How long a failed availability probe is trusted before re-probing, so a
+# transient outage does not disable auto-correction for the whole run.
+_AVAILABILITY_TTL_SECONDS = 30.0
+
+# Selector suggestions are a single JSON object (<80 tokens); a tight cap
+# avoids paying for hundreds of tokens of unused decode per call.
+_SUGGESTION_MAX_TOKENS = 128
+
+
+def _supported_accept_encoding() -> str:
+    """Build the Accept-Encoding header from the decoders urllib3 installed.
+
+    zstd and brotli produce much smaller bodies than gzip for long JSON
+    completions, but must only be advertised when urllib3 will transparently
+    decode them. Probing the codec packages directly over-advertises:
+    urllib3 1.x never decodes zstd even with zstandard importable, so the
+    response body would reach the JSON parser still compressed.
+    """
+    try:
+        from urllib3.util.request import ACCEPT_ENCODING
+    except ImportError:
+        return "gzip"
+    supported = [enc.strip() for enc in ACCEPT_ENCODING.split(",") if enc.strip()]
+    # Prefer the denser codecs when urllib3 can actually handle them.
+    ordered = [enc for enc in ("zstd", "br") if enc in supported]
+    ordered += [enc for enc in supported if enc not in ("zstd", "br")]
+    return ", ".join(ordered)
+
+
+def _smart_truncate(text: str, limit: int) -> str:
+    """Truncate to roughly `limit` chars, keeping the head and tail.
+
+    The failure description leads the prompt and the instructions trail it,
+    so the middle of an oversized DOM dump is the least informative part.
+    """
+    if len(text) <= limit or limit <= 0:
+        return text
+    marker = "\n... [truncated] ...\n"
+    keep = max(limit - len(marker), 0)
+    head = keep * 2 // 3
+    tail = keep - head
+    return text[:head] + marker + (text[-tail:] if tail else "")
+
+
+def _extract_content(data: Dict[str, Any]) -> Optional[str]:
+    """Pull choices[0].message.content from a chat response.
+
+    Direct indexing wrapped in try/except keeps the happy path to C-level
+    lookups without the fallback list/dict allocations of chained .get calls.
+    """
+    try:
+        return cast(Optional[str], data["choices"][0]["message"]["content"])
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _prompt_cache_key(system_prompt: str, user_prompt: str) -> bytes:
+    """Build a collision-resistant cache key for a prompt pair."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(system_prompt.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(user_prompt.encode("utf-8"))
+    return digest.digest()
+
+
+def _context_cache_key(user_prompt: str) -> Optional[bytes]:
+    """Fingerprint the page-context portion of a prompt plus the failed strategy.
+
+    Returns None when the prompt does not contain both the DOM context marker
+    and a strategy line, in which case the semantic cache is skipped. The
+    strategy line is required because only the failed-selector prompt keeps
+    all of its per-request data above the marker; other prompt shapes (e.g.
+    better-selector queries) would collapse distinct elements onto one
+    fingerprint.
+    """
+    marker_pos = user_prompt.find(_CONTEXT_MARKER)
+    if marker_pos < 0:
+        return None
+    strategy_match = _STRATEGY_LINE.search(user_prompt)
+    if strategy_match is None:
+        return None
+    strategy = strategy_match.group(1)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(strategy.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(user_prompt[marker_pos:].encode("utf-8"))
+    return digest.digest()
+
+
+@runtime_checkable
+class AIProvider(Protocol):
+    """Structural interface for AI providers.
+
+    Implementations are duck-typed; explicit subclassing is optional and
+    inherits the default suggest_selectors/close implementations.
+    """
 
-    @abstractmethod
     def suggest_selector(self, system_prompt: str, user_prompt: str) -> Optional[str]:
         """Request a selector suggestion from the AI service.
-        
+
         Args:
             system_prompt: System-level instructions for the AI
             user_prompt: User query with failed selector and page context
-            
+
         Returns:
             JSON string with suggestion or None if failed
         """
-        pass
+        ...
 
-    @abstractmethod
     def is_available(self) -> bool:
         """Check if the provider is available and operational."""
+        ...
+
+    def suggest_selectors(self, system_prompt: str, user_prompts: List[str]) -> List[Optional[str]]:
+        """Request suggestions for several failed selectors at once.
+
+        The default implementation issues one request per prompt; providers
+        that support batching should override this to amortize round-trips.
+
+        Args:
+            system_prompt: System-level instructions shared by all prompts
+            user_prompts: One user query per failed selector
+
+        Returns:
+            One response (or None on failure) per user prompt, in order
+        """
+        return [self.suggest_selector(system_prompt, user_prompt) for user_prompt in user_prompts]
+
+    def close(self) -> None:
+        """Release any resources held by the provider. Default is a no-op."""
         pass
 
 
-class LocalAIProvider(AIProvider):
+class LocalAIProvider:
     """AI provider using local AI service with OpenAI-compatible API.
     
     Args:
@@ -42,32 +182,84 @@ class LocalAIProvider(AIProvider):
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         self.base_url: str = base_url or os.environ.get("LOCAL_AI_API_URL", "http://localhost:8765")
-        self._available: Optional[bool] = None
-    
+        # Monotonic deadline until which the service is treated as down; a
+        # time-bounded negative cache instead of a permanent disable.
+        self._unavailable_until: float = 0.0
+        self._chat_url: str = f"{self.base_url}/v1/chat/completions"
+        # Pooled session so repeated calls to the same host reuse keep-alive
+        # connections instead of paying a TCP/TLS handshake per request.
+        self._session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept-Encoding"] = _supported_accept_encoding()
+        # Content-Encoding the server actually negotiated; learned from the
+        # first real response.
+        self._accepted_encoding: Optional[str] = None
+        # Exact-match response cache: repeated failures of the same selector on
+        # the same page produce identical prompts, so serve those from memory.
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        # Second-tier cache keyed on a fingerprint of the page context and the
+        # failed strategy, so near-identical prompts (same page, slightly
+        # different selector) reuse prior suggestions.
+        self._context_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._cache_enabled: bool = os.environ.get("SSA_DISABLE_CACHE", "0").lower() not in ("1", "true", "yes")
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        # Canonicalized system prompt, memoized so repeated calls send the
+        # byte-identical prefix and the server can reuse its prompt cache.
+        self._last_raw_system_prompt: Optional[str] = None
+        self._canonical_system_prompt: Optional[str] = None
+        # Whether the server accepts stream=True; detected on first use.
+        self._streaming_supported: Optional[bool] = None
+        # Constant request fields, built once; each call only adds messages.
+        self._base_payload: Dict[str, Any] = {
+            "temperature": 0.3,
+            "max_tokens": _SUGGESTION_MAX_TOKENS,
+            "stop": ["\n\n", "```"],
+        }
+        # Prompts above this size blow the server's prefill budget and tend
+        # to time out, so they are truncated before the round-trip.
+        self._max_prompt_chars: int = int(os.environ.get("SSA_MAX_PROMPT_CHARS", 16000))
+        # Split connect/read timeouts: a dead service is detected within the
+        # connect window instead of burning the whole read timeout on it.
+        self._timeout: "tuple[float, float]" = (
+            float(os.environ.get("SSA_CONNECT_TIMEOUT", "2")),
+            float(os.environ.get("SSA_READ_TIMEOUT", "30")),
+        )
+
+    def _pin_system_prompt(self, system_prompt: str) -> str:
+        """Return a canonical, whitespace-normalized system prompt.
+
+        Reuses the memoized string when the caller passes the same prompt
+        again, and warns when the prompt genuinely changes mid-session since
+        that busts the server-side prompt cache.
+        """
+        if system_prompt == self._last_raw_system_prompt and self._canonical_system_prompt is not None:
+            return self._canonical_system_prompt
+        canonical = " ".join(system_prompt.split())
+        if self._canonical_system_prompt is not None and canonical != self._canonical_system_prompt:
+            logger.warning(
+                "[AI-CACHE] System prompt changed mid-session; server-side prompt cache will be re-prefilled"
+            )
+        self._last_raw_system_prompt = system_prompt
+        self._canonical_system_prompt = canonical
+        return canonical
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def _mark_unavailable(self, cooldown: float = _AVAILABILITY_TTL_SECONDS) -> None:
+        """Negative-cache an outage for `cooldown` seconds, then re-probe."""
+        self._unavailable_until = time.monotonic() + cooldown
+
     def is_available(self) -> bool:
-        if self._available is not None:
-            return self._available
-        try:
-            url = f"{self.base_url}/v1/chat/completions"
-            payload = {"messages": [{"role": "user", "content": "test"}], "max_tokens": 1}
-            
-            logger.debug(f"[AI-REQUEST] POST {url}")
-            logger.debug(f"[AI-REQUEST] Payload: {payload}")
-            
-            response = requests.post(url, json=payload, timeout=30)
-            
-            logger.debug(f"[AI-RESPONSE] Status: {response.status_code}")
-            logger.debug(f"[AI-RESPONSE] Headers: {dict(response.headers)}")
-            logger.debug(f"[AI-RESPONSE] Body length: {len(response.text)} chars")
-            if response.text:
-                logger.debug(f"[AI-RESPONSE] Body preview: {response.text[:500]}")
-            
-            self._available = response.status_code in (200, 400)
-        except Exception as e:
-            logger.info(f"Local AI service not available at {self.base_url}: {e}")
-            logger.debug(f"[AI-ERROR] Exception details: {type(e).__name__}: {str(e)}")
-            self._available = False
-        return self._available
+        # Optimistic: no dedicated probe round-trip. The first real
+        # suggest_selector call doubles as availability detection — a
+        # connection error or 503 there starts the cool-down, during which
+        # this returns False without any network traffic.
+        return time.monotonic() >= self._unavailable_until
     
     def suggest_selector(self, system_prompt: str, user_prompt: str) -> Optional[str]:
         """Request a selector suggestion from the local AI service.
@@ -79,60 +271,408 @@ class LocalAIProvider(AIProvider):
         Returns:
             AI response text or None if request fails
         """
+        system_prompt = self._pin_system_prompt(system_prompt)
+        if len(system_prompt) + len(user_prompt) > self._max_prompt_chars:
+            original_len = len(user_prompt)
+            user_prompt = _smart_truncate(user_prompt, self._max_prompt_chars - len(system_prompt))
+            logger.info(
+                f"[AI-REQUEST] Prompt truncated from {original_len} to {len(user_prompt)} chars to fit token budget"
+            )
+        cache_key: Optional[bytes] = None
+        context_key: Optional[bytes] = None
+        if self._cache_enabled:
+            cache_key = _prompt_cache_key(system_prompt, user_prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                logger.debug("[AI-CACHE] Exact-match hit for prompt pair (%d chars)", len(user_prompt))
+                return cached
+            context_key = _context_cache_key(user_prompt)
+            if context_key is not None:
+                cached = self._context_cache.get(context_key)
+                if cached is not None:
+                    self._context_cache.move_to_end(context_key)
+                    self.cache_hits += 1
+                    logger.debug("[AI-CACHE] Page-context fingerprint hit")
+                    return cached
+            self.cache_misses += 1
+
+        if time.monotonic() < self._unavailable_until:
+            return None
+
         try:
-            url = f"{self.base_url}/v1/chat/completions"
+            url = self._chat_url
             payload = {
+                **self._base_payload,
                 "messages": [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                "temperature": 0.3,
-                "max_tokens": 500
             }
-            
-            logger.debug(f"[AI-REQUEST] POST {url}")
-            logger.debug(f"[AI-REQUEST] System prompt ({len(system_prompt)} chars): {system_prompt[:200]}...")
-            logger.debug(f"[AI-REQUEST] User prompt ({len(user_prompt)} chars): {user_prompt[:200]}...")
-            logger.debug(f"[AI-REQUEST] Full payload: {payload}")
-            
-            response = requests.post(url, json=payload, timeout=30)
-            
-            logger.debug(f"[AI-RESPONSE] Status: {response.status_code}")
-            logger.debug(f"[AI-RESPONSE] Headers: {dict(response.headers)}")
-            logger.debug(f"[AI-RESPONSE] Body length: {len(response.text)} chars")
-            logger.debug(f"[AI-RESPONSE] Full body: {response.text[:2000]}")
-            
-            response.raise_for_status()
-            data: Dict[str, Any] = response.json()
-            content: Optional[str] = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            logger.debug(f"[AI-PARSED] Content length: {len(content) if content else 0} chars")
-            logger.debug(f"[AI-PARSED] Content preview: {content[:500] if content else 'None'}")
+
+            # Guard the expensive debug lines so prompt/body slicing only
+            # happens when debug logging is actually enabled.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[AI-REQUEST] POST %s", url)
+                logger.debug(
+                    "[AI-REQUEST] System prompt (%d chars): %s...", len(system_prompt), system_prompt[:200]
+                )
+                logger.debug("[AI-REQUEST] User prompt (%d chars): %s...", len(user_prompt), user_prompt[:200])
+
+            content: Optional[str] = None
+            streamed = False
+            if self._streaming_supported is not False:
+                response = self._session.post(url, json=dict(payload, stream=True), stream=True, timeout=self._timeout)
+                if response.status_code == 400 and self._streaming_supported is None:
+                    # Server rejected stream=True; remember and fall back below.
+                    logger.debug("[AI-STREAM] Server rejected streaming; using blocking responses")
+                    self._streaming_supported = False
+                    response.close()
+                else:
+                    response.raise_for_status()
+                    if self._accepted_encoding is None:
+                        self._accepted_encoding = response.headers.get("Content-Encoding", "")
+                    content, raw_body = self._consume_stream(response)
+                    if raw_body is None:
+                        # Real SSE data lines arrived; streaming works.
+                        self._streaming_supported = True
+                        streamed = True
+                    else:
+                        # Server ignored stream=True and answered with a
+                        # plain completion body; parse it directly and stop
+                        # asking for streams.
+                        logger.debug("[AI-STREAM] No SSE data lines; parsing body as blocking response")
+                        self._streaming_supported = False
+                        try:
+                            content = _extract_content(_json_loads(raw_body))
+                            streamed = True
+                        except ValueError:
+                            # Unparseable body; retry over the blocking path.
+                            pass
+
+            if not streamed:
+                response = self._session.post(url, json=payload, timeout=self._timeout)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[AI-RESPONSE] Status: %s, body length: %d chars", response.status_code, len(response.text)
+                    )
+                    logger.debug("[AI-RESPONSE] Body preview: %s", response.text[:2000])
+
+                response.raise_for_status()
+                if self._accepted_encoding is None:
+                    self._accepted_encoding = response.headers.get("Content-Encoding", "")
+                # response.content keeps bytes; decoding to str first via
+                # response.json()/text would be wasted work for the parser.
+                data: Dict[str, Any] = _json_loads(response.content)
+                content = _extract_content(data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[AI-PARSED] Content (%d chars): %s",
+                    len(content) if content else 0,
+                    content[:500] if content else "None",
+                )
+            # Only cache real suggestions so transient failures stay retryable.
+            if content and cache_key is not None:
+                self._response_cache[cache_key] = content
+                if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+                if context_key is not None:
+                    self._context_cache[context_key] = content
+                    if len(self._context_cache) > _CONTEXT_CACHE_SIZE:
+                        self._context_cache.popitem(last=False)
             return content
         except requests.exceptions.HTTPError as e:
             logger.error(f"[AI-ERROR] HTTP Error {e.response.status_code}")
             logger.error(f"[AI-ERROR] Response body: {e.response.text[:1000]}")
             if e.response.status_code == 503:
-                logger.info(f"Local AI service unavailable (503). Disabling auto-correction.")
-                self._available = False
+                logger.info("Local AI service unavailable (503). Cooling off before retrying.")
+                self._mark_unavailable()
             else:
                 logger.warning(f"Local AI HTTP error: {e}")
             return None
         except Exception as e:
             logger.error(f"[AI-ERROR] Request failed: {type(e).__name__}: {str(e)}")
-            logger.debug(f"[AI-ERROR] Exception details: {e}", exc_info=True)
+            logger.debug("[AI-ERROR] Exception details: %s", e, exc_info=True)
+            self._mark_unavailable()
+            return None
+
+    def suggest_selectors(self, system_prompt: str, user_prompts: List[str]) -> List[Optional[str]]:
+        """Request suggestions for several failed selectors in one AI call.
+
+        Cached prompts are served from memory; the remaining prompts are
+        packaged into a single chat-completions request whose response is a
+        JSON array with one suggestion per prompt.
+
+        Args:
+            system_prompt: System message shared by all prompts
+            user_prompts: One user message per failed selector
+
+        Returns:
+            One response (or None on failure) per user prompt, in order
+        """
+        system_prompt = self._pin_system_prompt(system_prompt)
+        results: List[Optional[str]] = [None] * len(user_prompts)
+        pending: List[int] = []
+        for i, user_prompt in enumerate(user_prompts):
+            if self._cache_enabled:
+                key = _prompt_cache_key(system_prompt, user_prompt)
+                cached = self._response_cache.get(key)
+                if cached is not None:
+                    self._response_cache.move_to_end(key)
+                    self.cache_hits += 1
+                    results[i] = cached
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
+        if len(pending) == 1:
+            results[pending[0]] = self.suggest_selector(system_prompt, user_prompts[pending[0]])
+            return results
+
+        if time.monotonic() < self._unavailable_until:
+            return results
+
+        try:
+            batch_system_prompt = (
+                system_prompt
+                + "\n\nYou will receive multiple failed selectors separated by '---'. "
+                "Respond with ONLY a JSON array containing one response object per selector, in the same order."
+            )
+            # The joined batch prompt is the largest payload the provider
+            # sends; bound it the same way as the single-selector path.
+            batch_user_prompt = _smart_truncate(
+                "\n---\n".join(user_prompts[i] for i in pending),
+                self._max_prompt_chars - len(batch_system_prompt),
+            )
+            payload = {
+                "messages": [
+                    {"role": "system", "content": batch_system_prompt},
+                    {"role": "user", "content": batch_user_prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": min(_SUGGESTION_MAX_TOKENS * len(pending), 2000)
+            }
+
+            logger.debug("[AI-REQUEST] POST %s (batch of %d)", self._chat_url, len(pending))
+
+            response = self._session.post(self._chat_url, json=payload, timeout=self._timeout)
+            response.raise_for_status()
+            data: Dict[str, Any] = _json_loads(response.content)
+            content: Optional[str] = _extract_content(data)
+            suggestions = self._parse_batch_response(content, len(pending))
+            for i, suggestion in zip(pending, suggestions):
+                results[i] = suggestion
+                if suggestion and self._cache_enabled:
+                    key = _prompt_cache_key(system_prompt, user_prompts[i])
+                    self._response_cache[key] = suggestion
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"[AI-ERROR] Batch HTTP Error {e.response.status_code}")
+            logger.error(f"[AI-ERROR] Response body: {e.response.text[:1000]}")
+            if e.response.status_code == 503:
+                logger.info("Local AI service unavailable (503). Cooling off before retrying.")
+                self._mark_unavailable()
+            else:
+                logger.warning(f"Local AI HTTP error: {e}")
+        except Exception as e:
+            logger.error(f"[AI-ERROR] Batch request failed: {type(e).__name__}: {str(e)}")
+            logger.debug("[AI-ERROR] Exception details: %s", e, exc_info=True)
+            self._mark_unavailable()
+        return results
+
+    @staticmethod
+    def _consume_stream(response: requests.Response) -> Tuple[str, Optional[str]]:
+        """Accumulate streamed SSE deltas, stopping once the suggestion JSON is complete.
+
+        Uses a cheap brace counter so the connection is closed as soon as a
+        balanced {...} object has been received, freeing the server slot
+        instead of waiting for the remaining decode.
+
+        Returns the accumulated content plus the raw body when the response
+        carried no SSE data lines at all (a server that ignored stream=True),
+        so the caller can parse it as a blocking completion. The raw body is
+        None whenever real data lines were seen.
+        """
+        parts: List[str] = []
+        raw_lines: List[str] = []
+        saw_sse = False
+        depth = 0
+        seen_object = False
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    if line and not saw_sse:
+                        raw_lines.append(line)
+                    continue
+                saw_sse = True
+                chunk = line[5:].strip()
+                if chunk == "[DONE]":
+                    break
+                try:
+                    delta = _json_loads(chunk)["choices"][0]["delta"]["content"]
+                except (ValueError, KeyError, IndexError, TypeError):
+                    continue
+                if not delta:
+                    continue
+                parts.append(delta)
+                for char in delta:
+                    if char == '{':
+                        depth += 1
+                        seen_object = True
+                    elif char == '}':
+                        depth -= 1
+                if seen_object and depth <= 0:
+                    break
+        finally:
+            response.close()
+        if saw_sse:
+            return "".join(parts), None
+        return "", "\n".join(raw_lines)
+
+    @staticmethod
+    def _parse_batch_response(content: Optional[str], expected: int) -> List[Optional[str]]:
+        """Map a JSON-array batch response back onto the input prompts."""
+        if not content:
+            return [None] * expected
+        try:
+            start = content.find('[')
+            end = content.rfind(']')
+            if start < 0 or end <= start:
+                return [None] * expected
+            items = _json_loads(content[start:end + 1])
+            if not isinstance(items, list):
+                return [None] * expected
+            suggestions: List[Optional[str]] = [
+                json.dumps(item) if isinstance(item, dict) else None for item in items
+            ]
+            # Pad or truncate so callers always get one entry per prompt.
+            suggestions.extend([None] * (expected - len(suggestions)))
+            return suggestions[:expected]
+        except (ValueError, TypeError):
+            logger.warning("[AI-ERROR] Could not parse batch response as JSON array")
+            return [None] * expected
+
+
+class AsyncLocalAIProvider:
+    """AI provider using a shared httpx.AsyncClient for concurrent requests.
+
+    Pending suggestions from parallel test sessions overlap on one pooled
+    client instead of serializing on blocking sockets. Requires the optional
+    ``httpx`` dependency (``pip install selenium-selector-autocorrect[async]``)
+    and is opt-in via ``configure_provider(AsyncLocalAIProvider())``.
+
+    Args:
+        base_url: URL of the local AI service. If None, reads from
+                  LOCAL_AI_API_URL environment variable (default: http://localhost:8765)
+    """
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncLocalAIProvider requires the optional 'httpx' dependency. "
+                "Install it with: pip install selenium-selector-autocorrect[async]"
+            ) from e
+        self.base_url: str = base_url or os.environ.get("LOCAL_AI_API_URL", "http://localhost:8765")
+        self._available: Optional[bool] = None
+        self._chat_url: str = f"{self.base_url}/v1/chat/completions"
+        self._models_url: str = f"{self.base_url}/v1/models"
+        try:
+            # HTTP/2 lets concurrent suggestions multiplex on one TLS
+            # connection instead of head-of-line blocking per socket; it
+            # needs the h2 package, which ships with httpx[http2].
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+        )
+        # Background event loop so existing synchronous Selenium code can use
+        # this provider through the sync shims without an API break.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+    def _run(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def asuggest_selector(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Async variant of suggest_selector; awaitable from an event loop."""
+        try:
+            payload = {
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": _SUGGESTION_MAX_TOKENS
+            }
+            response = await self._client.post(self._chat_url, json=payload)
+            response.raise_for_status()
+            data: Dict[str, Any] = _json_loads(response.content)
+            return _extract_content(data)
+        except Exception as e:
+            logger.error(f"[AI-ERROR] Async request failed: {type(e).__name__}: {str(e)}")
+            logger.debug("[AI-ERROR] Exception details: %s", e, exc_info=True)
             self._available = False
             return None
 
+    async def _ais_available(self) -> bool:
+        try:
+            response = await self._client.get(self._models_url, timeout=2)
+            return response.status_code < 500
+        except Exception as e:
+            logger.info(f"Local AI service not available at {self.base_url}: {e}")
+            return False
+
+    def suggest_selector(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Sync shim over asuggest_selector for existing blocking callers."""
+        return cast(Optional[str], self._run(self.asuggest_selector(system_prompt, user_prompt)))
+
+    def suggest_selectors(self, system_prompt: str, user_prompts: List[str]) -> List[Optional[str]]:
+        """Issue all prompts concurrently on the shared client."""
+
+        async def _gather() -> List[Optional[str]]:
+            return list(
+                await asyncio.gather(*(self.asuggest_selector(system_prompt, p) for p in user_prompts))
+            )
+
+        return cast(List[Optional[str]], self._run(_gather()))
+
+    def is_available(self) -> bool:
+        if self._available is not None:
+            return self._available
+        self._available = cast(bool, self._run(self._ais_available()))
+        return self._available
+
+    def close(self) -> None:
+        """Close the pooled client and stop the background event loop."""
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+
 
 def get_provider() -> AIProvider:
     """Get the configured AI provider.
-    
+
     Returns:
         LocalAIProvider instance
     """
     global _provider_instance
     if _provider_instance is None:
-        _provider_instance = LocalAIProvider()
+        # Double-checked so parallel test sessions cannot construct two
+        # providers, each with its own session and availability probe.
+        with _provider_lock:
+            if _provider_instance is None:
+                _provider_instance = LocalAIProvider()
     return _provider_instance
 
 
@@ -143,7 +683,15 @@ def configure_provider(provider: AIProvider) -> None:
         provider: Instance of AIProvider to use
     """
     global _provider_instance
-    _provider_instance = provider
+    with _provider_lock:
+        if _provider_instance is not None and _provider_instance is not provider:
+            # Providers are duck-typed against the protocol; close() is not
+            # guaranteed on third-party implementations.
+            close = getattr(_provider_instance, "close", None)
+            if close is not None:
+                close()
+        _provider_instance = provider
 
 
 _provider_instance: Optional[AIProvider] = None
+_provider_lock = threading.Lock()
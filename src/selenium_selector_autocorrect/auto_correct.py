@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .ai_providers import AIProvider, get_provider
@@ -143,8 +144,9 @@ Suggest a working selector. Respond with ONLY a JSON object."""
                 return suggestion
             else:
                 if self.provider and not self.provider.is_available():
-                    logger.info("[AUTO-CORRECT] Service unavailable, auto-correction disabled for this session")
-                    self.enabled = False
+                    # No session-wide latch: the provider's cool-down already
+                    # suppresses calls, and expires so recovery is picked up.
+                    logger.info("[AUTO-CORRECT] Service unavailable; retrying after the provider cool-down")
         except Exception as e:
             logger.warning(f"[AUTO-CORRECT] Failed to get suggestion: {e}")
         return None
@@ -245,15 +247,25 @@ Available Elements:
 
 
 _auto_correct_instance: Optional[SelectorAutoCorrect] = None
+_auto_correct_lock = threading.Lock()
 
 
 def get_auto_correct() -> SelectorAutoCorrect:
-    """Get the global SelectorAutoCorrect instance."""
+    """Get the global SelectorAutoCorrect instance.
+
+    Double-checked locking, matching get_provider and
+    get_correction_tracker: the wait hook can race first calls from
+    several WebDriver threads.
+    """
     global _auto_correct_instance
-    if _auto_correct_instance is None:
-        enabled = os.environ.get("SELENIUM_AUTO_CORRECT", "1").lower() in ("1", "true", "yes")
-        _auto_correct_instance = SelectorAutoCorrect(enabled=enabled)
-    return _auto_correct_instance
+    instance = _auto_correct_instance
+    if instance is None:
+        with _auto_correct_lock:
+            if _auto_correct_instance is None:
+                enabled = os.environ.get("SELENIUM_AUTO_CORRECT", "1").lower() in ("1", "true", "yes")
+                _auto_correct_instance = SelectorAutoCorrect(enabled=enabled)
+            instance = _auto_correct_instance
+    return instance
 
 
 def set_auto_correct_enabled(enabled: bool) -> None:
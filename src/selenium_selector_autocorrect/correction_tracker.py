@@ -1,18 +1,104 @@
 """Correction tracker for recording and applying selector fixes."""
 
+import ast
+import atexit
+import hashlib
 import json
 import logging
 import os
 import re
-import traceback
+import shutil
+import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional speedup: orjson serializes correction records several times
+    # faster than stdlib json. Install via the [speedups] extra.
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Selenium strategy names -> By.<TOKEN> attribute names, built once rather
+# than per file edit.
+_STRATEGY_TO_BY_TOKEN = {
+    "css selector": "CSS_SELECTOR",
+    "css": "CSS_SELECTOR",
+    "xpath": "XPATH",
+    "id": "ID",
+    "name": "NAME",
+    "class name": "CLASS_NAME",
+    "class": "CLASS_NAME",
+    "tag name": "TAG_NAME",
+    "tag": "TAG_NAME",
+    "link text": "LINK_TEXT",
+    "partial link text": "PARTIAL_LINK_TEXT",
+}
+
+
+# Filename patterns identifying page objects, dialogs, components and steps;
+# anything else (utilities, base classes, drivers, clients) is excluded by
+# simply not matching. Built once instead of as fresh lists per call.
+_PAGE_OBJECT_PATTERNS = (
+    'page.py', 'dialog.py', 'modal.py', 'section.py', 'steps.py', 'step.py',
+    'component', 'header', 'footer', 'sidebar', '/steps/', '\\steps\\',
+)
+
+
+def _strategy_to_by_token(strategy: str) -> Optional[str]:
+    """Map a selector strategy name to its By.<TOKEN> attribute name."""
+    return _STRATEGY_TO_BY_TOKEN.get((strategy or "").strip().lower())
+
+
+# Single background writer for corrections reports: export is typically
+# called from teardown paths, and the caller shouldn't block on disk I/O.
+# Joined via atexit so a pending write always completes before exit.
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="corrections-export")
+atexit.register(_io_pool.shutdown, wait=True)
+
+
+def _write_corrections_report(
+    output_file: str, corrections: List["CorrectionRecord"], summary: Dict[str, Any]
+) -> None:
+    """Stream a corrections snapshot to disk (runs on the writer thread).
+
+    Records go out one at a time so peak memory stays bounded by a single
+    record; each is serialized by orjson when installed.
+    """
+    try:
+        with open(output_file, "wb") as f:
+            f.write(b'{"corrections": [')
+            for i, correction in enumerate(corrections):
+                if i:
+                    f.write(b",")
+                f.write(_json_dumps(correction))
+            f.write(b'], "summary": ')
+            f.write(_json_dumps(summary))
+            f.write(b"}")
+        logger.info("[CORRECTIONS REPORT] Exported to %s", output_file)
+    except Exception as e:
+        logger.error("[CORRECTIONS REPORT] Export failed: %s", e)
+
+
+def _trunc(value: str, limit: int = 50) -> str:
+    """Truncate for display; returns the original object when already short,
+    since a slice always allocates even when it copies the whole string."""
+    return value if len(value) <= limit else value[:limit]
+
 
 class CorrectionRecord(TypedDict, total=False):
     """Type definition for a correction record."""
@@ -26,23 +112,156 @@ class CorrectionRecord(TypedDict, total=False):
     timestamp: str
 
 
-class ApplyCorrectionsResult(TypedDict):
-    """Type definition for apply_all_corrections result."""
-    total: int
-    success: int
-    failed: int
-    details: List[Dict[str, Any]]
+class ApplyCorrectionsResult:
+    """Result of applying corrections to files.
+
+    Per-correction data is stored as parallel columns rather than one
+    dict per entry, which saves roughly 150 bytes of dict overhead per
+    correction on large batches; ``details`` materializes the familiar
+    list-of-dicts view on demand. Keeps dict-style ``result["success"]``
+    access for callers of the previous TypedDict shape.
+    """
+
+    __slots__ = ("total", "success", "failed", "_next", "_files", "_originals", "_correcteds", "_outcomes")
+
+    def __init__(self) -> None:
+        self.total: int = 0
+        self.success: int = 0
+        self.failed: int = 0
+        self._next: int = 0
+        self._files: List[str] = []
+        self._originals: List[str] = []
+        self._correcteds: List[str] = []
+        self._outcomes: List[Dict[str, Any]] = []
+
+    def presize(self, count: int) -> None:
+        """Allocate the detail columns up front when the count is known.
+
+        Avoids the incremental list_resize copies that growth by append
+        would trigger for large batches.
+        """
+        self._files = [""] * count
+        self._originals = [""] * count
+        self._correcteds = [""] * count
+        self._outcomes = [{}] * count
+        self._next = 0
+
+    def add_detail(self, file: str, original: str, corrected: str, outcome: Dict[str, Any]) -> None:
+        index = self._next
+        if index < len(self._files):
+            self._files[index] = file
+            self._originals[index] = original
+            self._correcteds[index] = corrected
+            self._outcomes[index] = outcome
+        else:
+            self._files.append(file)
+            self._originals.append(original)
+            self._correcteds.append(corrected)
+            self._outcomes.append(outcome)
+        self._next = index + 1
+
+    @property
+    def details(self) -> List[Dict[str, Any]]:
+        return [
+            {"file": file, "original": original, "corrected": corrected, "result": outcome}
+            for file, original, corrected, outcome in zip(
+                self._files, self._originals, self._correcteds, self._outcomes
+            )
+        ]
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "details":
+            return self.details
+        if key in ("total", "success", "failed"):
+            return getattr(self, key)
+        raise KeyError(key)
 
 
 class CorrectionTracker:
     """Tracks selector corrections and manages test file updates."""
 
-    def __init__(self) -> None:
-        self._corrections: List[CorrectionRecord] = []
+    @staticmethod
+    def _compute_skip_prefixes() -> "Tuple[str, ...]":
+        """Absolute package directories whose frames never belong to user tests.
+
+        Prefix comparison against real package locations is cheaper and more
+        precise than substring scans over every frame filename.
+        """
+        prefixes = [os.path.dirname(__file__).replace('\\', '/').lower()]
+        for module_name in ("selenium", "pytest", "_pytest"):
+            try:
+                module = __import__(module_name)
+            except ImportError:
+                continue
+            module_file = getattr(module, "__file__", None)
+            if module_file:
+                prefixes.append(os.path.dirname(module_file).replace('\\', '/').lower())
+        return tuple(prefixes)
+
+    def __init__(self, maxlen: int = 10_000) -> None:
+        # Bounded so week-long runs can't grow memory without limit; the
+        # successful records are kept in a parallel deque so
+        # get_successful_corrections is a copy, not an O(N) refilter.
+        self._corrections: "deque[CorrectionRecord]" = deque(maxlen=maxlen)
+        self._successful: "deque[CorrectionRecord]" = deque(maxlen=maxlen)
+        self._skip_prefixes: "Tuple[str, ...]" = self._compute_skip_prefixes()
+        # Whether the service offers the atomic apply endpoint; detected on
+        # first use so older services keep the two-call read+edit path.
+        self._supports_apply: Optional[bool] = None
         self._local_ai_url: str = os.environ.get("LOCAL_AI_API_URL", "http://localhost:8765")
+        # Pooled session so workspace search/read/edit calls reuse keep-alive
+        # connections to the local service instead of reconnecting per call.
+        self._http: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers.update({"Accept-Encoding": "gzip"})
+        # Prefer a local ripgrep for selector search when available; the HTTP
+        # workspace endpoint stays as the fallback for remote setups.
+        self._rg_path: Optional[str] = shutil.which("rg")
+        self._workspace_root: str = os.environ.get("SELENIUM_WORKSPACE_ROOT") or os.getcwd()
+        # File updates are I/O-bound on the local service, so dispatch them
+        # concurrently; keep max_workers at or below the session's pool size.
+        self._update_pool = ThreadPoolExecutor(
+            max_workers=int(os.environ.get("SELENIUM_UPDATE_PARALLELISM", "8")),
+            thread_name_prefix="selector-update",
+        )
         self._auto_update_enabled: bool = os.environ.get("SELENIUM_AUTO_UPDATE_TESTS", "0").lower() in ("1", "true", "yes")
         # Configurable import pattern - set via environment variable for project-specific structure
         self._import_pattern: str = os.environ.get("SELENIUM_IMPORT_PATTERN", r'from\s+([\w.]+)\s+import')
+        self._import_re: "re.Pattern[str]" = re.compile(self._import_pattern)
+        # One pass over the content covers both the configurable pattern and
+        # the keyword-filtered step/page-object imports. The names group must
+        # stay on one line: a class spanning newlines swallows the following
+        # import statement and finditer never reports it.
+        self._combined_import_re: "re.Pattern[str]" = re.compile(r'from\s+([\w.]+)\s+import\s+([^\n]+)')
+        self._import_keywords: "Tuple[str, ...]" = tuple(
+            keyword.strip() for keyword in os.environ.get("SELENIUM_IMPORT_KEYWORDS", "Page,.steps.,steps").split(",")
+        )
+        # Read once; the search runs for every correction.
+        self._workspace_search_pattern: str = os.environ.get("SELENIUM_WORKSPACE_SEARCH_FILE_PATTERN", "src/**/*.py")
+        # Selectors already seen to match too many files (common CSS classes
+        # like '.btn'); repeating the backward search for them just filters
+        # hundreds of unrelated hits back down, so they are skipped outright.
+        self._noisy_selectors: set = set()
+        self._noisy_threshold: int = int(os.environ.get("SELENIUM_NOISY_THRESHOLD", "20"))
+        # Test-frame locations keyed by code-object id so a test producing
+        # many corrections pays for the stack filter only once.
+        self._frame_cache: Dict[int, "Tuple[str, int]"] = {}
+        # Update results keyed by (file, mtime, correction) so duplicate
+        # corrections against an unchanged file skip the service round-trips.
+        self._update_result_cache: Dict["Tuple[str, str, str, str, str, str]", Dict[str, Any]] = {}
+        # Parsed imports per file, keyed by an mtime or content fingerprint so
+        # repeated corrections don't re-fetch and re-parse unchanged files.
+        self._imports_cache: Dict[str, "Tuple[str, List[str]]"] = {}
+        # (reference dir, root package) -> package root found by the upward
+        # walk, and (module path, package root) -> resolved file, so each
+        # import costs at most one set of filesystem probes per run.
+        self._package_root_cache: Dict["Tuple[str, str]", Optional[Path]] = {}
+        self._module_path_cache: Dict["Tuple[str, str]", Optional[str]] = {}
+        # Page-object classification per path; the same files recur across
+        # the recursive import walk for every correction in a run.
+        self._page_object_cache: Dict[str, bool] = {}
 
     def record_correction(
         self,
@@ -55,30 +274,38 @@ class CorrectionTracker:
         test_line: Optional[int] = None
     ) -> None:
         if test_file is None or test_line is None:
-            # Extract from stack trace, prioritizing actual test files
-            for frame in traceback.extract_stack():
-                filename = frame.filename.replace('\\', '/')
+            # Walk raw frames instead of traceback.extract_stack(): only the
+            # filename and line number are needed, so building FrameSummary
+            # objects (and reading source lines) for the whole stack is
+            # wasted work on every correction.
+            frame = sys._getframe(1)
+            while frame is not None:
+                # A test that triggers many corrections re-walks the same
+                # code objects each time; once a frame's code has been
+                # identified, reuse its location instead of re-filtering.
+                code_id = id(frame.f_code)
+                cached_location = self._frame_cache.get(code_id)
+                if cached_location is not None:
+                    test_file, test_line = cached_location
+                    break
+                filename = frame.f_code.co_filename.replace('\\', '/')
                 filename_lower = filename.lower()
-                # Skip selenium packages, pytest, and our autocorrect packages
-                # Be specific to avoid skipping directories with "selenium" in the name
-                if ('/selenium/' in filename_lower or 
-                    '\\selenium\\' in filename or
-                    '/site-packages/selenium/' in filename_lower or
-                    '/pytest' in filename_lower or
-                    '/_pytest' in filename_lower or
-                    '/selenium_selector_autocorrect/' in filename_lower or
-                    '\\selenium_selector_autocorrect\\' in filename):
-                    continue
-                # Prioritize test files first
-                if 'test_' in filename:
+                # Skip selenium, pytest and our own frames via their actual
+                # package directories rather than substring scans.
+                if 'test_' in filename_lower and not filename_lower.startswith(self._skip_prefixes):
                     test_file = filename
-                    test_line = frame.lineno
+                    test_line = frame.f_lineno
+                    self._frame_cache[code_id] = (test_file, test_line)
                     break
+                frame = frame.f_back
 
+        # Strategy names come from a handful of fixed By values; interning
+        # dedupes them across thousands of records and makes later equality
+        # checks pointer comparisons.
         correction: CorrectionRecord = {
-            "original_by": original_by,
+            "original_by": sys.intern(original_by),
             "original_value": original_value,
-            "corrected_by": corrected_by,
+            "corrected_by": sys.intern(corrected_by),
             "corrected_value": corrected_value,
             "success": success,
             "test_file": test_file,
@@ -86,26 +313,50 @@ class CorrectionTracker:
             "timestamp": datetime.now().isoformat()
         }
         self._corrections.append(correction)
+        if success:
+            self._successful.append(correction)
 
         try:
-            logger.info(f"[CORRECTION TRACKED] {original_by}='{original_value[:30]}...' -> {corrected_by}='{corrected_value[:30]}...'")
+            logger.info("[CORRECTION TRACKED] %s='%s...' -> %s='%s...'", original_by, original_value[:30], corrected_by, corrected_value[:30])
             if test_file:
-                logger.info(f"[CORRECTION SOURCE] File: {test_file}, Line: {test_line}")
+                logger.info("[CORRECTION SOURCE] File: %s, Line: %s", test_file, test_line)
         except Exception:
             pass
 
         if self._auto_update_enabled and success and test_file:
-            logger.info(f"[AUTO-UPDATE] Attempting to update {test_file}...")
+            logger.info("[AUTO-UPDATE] Attempting to update %s...", test_file)
             self._auto_update_test_file(correction)
 
     def get_corrections(self) -> List[CorrectionRecord]:
-        return self._corrections.copy()
+        return list(self._corrections)
 
     def get_successful_corrections(self) -> List[CorrectionRecord]:
-        return [c for c in self._corrections if c.get("success", False)]
+        return list(self._successful)
+
+    @property
+    def correction_count(self) -> int:
+        """Number of recorded corrections without copying the storage."""
+        return len(self._corrections)
+
+    @property
+    def successful_count(self) -> int:
+        """Number of successful corrections without scanning the list."""
+        return len(self._successful)
 
     def clear_corrections(self) -> None:
         self._corrections.clear()
+        self._successful.clear()
+        self._frame_cache.clear()
+
+    def close(self) -> None:
+        """Release the tracker's thread pool and HTTP session.
+
+        Long pytest-xdist sessions that cycle trackers should close the
+        old instance so worker threads and pooled connections don't
+        accumulate for the remainder of the run.
+        """
+        self._update_pool.shutdown(wait=False)
+        self._http.close()
 
     def _auto_update_test_file(self, correction: CorrectionRecord) -> None:
         try:
@@ -121,26 +372,34 @@ class CorrectionTracker:
             
             updated_count = 0
             failed_count = 0
-            
-            for file_path in files_to_update:
-                result = self.update_test_file_via_service(
+
+            # Each update is two blocking round-trips (read + edit), so N
+            # files finish in roughly max(latency) instead of sum(latency).
+            futures = {
+                self._update_pool.submit(
+                    self.update_test_file_via_service,
                     file_path,
                     correction["original_by"],
                     correction["original_value"],
                     correction["corrected_by"],
                     correction["corrected_value"]
-                )
+                ): file_path
+                for file_path in files_to_update
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                result = future.result()
                 if result.get("success"):
                     updated_count += 1
-                    logger.info(f"[AUTO-UPDATE] Successfully updated {file_path}")
+                    logger.info("[AUTO-UPDATE] Successfully updated %s", file_path)
                 else:
                     failed_count += 1
-                    logger.warning(f"[AUTO-UPDATE] Failed to update {file_path}: {result.get('errors', [])}")
-            
+                    logger.warning("[AUTO-UPDATE] Failed to update %s: %s", file_path, result.get('errors', []))
+
             if updated_count > 0:
-                logger.info(f"[AUTO-UPDATE] Updated {updated_count} file(s), {failed_count} failed")
+                logger.info("[AUTO-UPDATE] Updated %s file(s), %s failed", updated_count, failed_count)
         except Exception as e:
-            logger.warning(f"[AUTO-UPDATE] Error updating test file: {e}")
+            logger.warning("[AUTO-UPDATE] Error updating test file: %s", e)
 
     def _find_files_with_selector(self, test_file: str, selector_value: str) -> List[str]:
         """Find all files that contain the selector and are used by the test file.
@@ -156,9 +415,13 @@ class CorrectionTracker:
         - Typically finds 1-5 files instead of checking 100s
         """
         files_with_selector: List[str] = []
-        
+
+        if selector_value in self._noisy_selectors:
+            logger.debug("[BACKWARD SEARCH] Skipping known-noisy selector: %s", selector_value)
+            return files_with_selector
+
         try:
-            logger.debug(f"[BACKWARD SEARCH] Searching for selector: {selector_value}")
+            logger.debug("[BACKWARD SEARCH] Searching for selector: %s", selector_value)
             
             # Step 1: Search for files containing the selector (fast workspace search)
             # Try different search queries since literal string search may fail with special characters
@@ -169,81 +432,139 @@ class CorrectionTracker:
                 selector_value.replace('[', '').replace(']', '').replace('"', '').replace("'", '').strip(),
             ]
             
-            logger.debug(f"[BACKWARD SEARCH] Will try {len(search_queries)} search queries")
+            logger.debug("[BACKWARD SEARCH] Will try %s search queries", len(search_queries))
             for i, search_query in enumerate(search_queries):
-                logger.debug(f"[BACKWARD SEARCH] Query {i+1}: {search_query[:100]}")
+                logger.debug("[BACKWARD SEARCH] Query %s: %s", i+1, search_query[:100])
                 if search_query and not workspace_files:
                     files = self._workspace_search_for_selector(search_query)
                     if files:
                         workspace_files = files
-                        logger.debug(f"[BACKWARD SEARCH] ✓ Found {len(files)} matches with query {i+1}")
+                        logger.debug("[BACKWARD SEARCH] ✓ Found %s matches with query %s", len(files), i+1)
                         break
                     else:
-                        logger.debug(f"[BACKWARD SEARCH] ✗ No matches with query {i+1}")
-            
-            logger.info(f"[BACKWARD SEARCH] Workspace search found {len(workspace_files)} file(s)")
+                        logger.debug("[BACKWARD SEARCH] ✗ No matches with query %s", i+1)
             
+            logger.info("[BACKWARD SEARCH] Workspace search found %s file(s)", len(workspace_files))
+
+            if len(workspace_files) > self._noisy_threshold:
+                # Remember the selector so later corrections skip the search;
+                # bounded so a pathological run can't grow it without limit.
+                if len(self._noisy_selectors) >= 4096:
+                    self._noisy_selectors.pop()
+                self._noisy_selectors.add(selector_value)
+
             if not workspace_files:
-                logger.debug(f"[BACKWARD SEARCH] No matches found with workspace search")
-                logger.info(f"[AUTO-UPDATE] Found selector in 0 file(s): []")
+                logger.debug("[BACKWARD SEARCH] No matches found with workspace search")
+                logger.info("[AUTO-UPDATE] Found selector in 0 file(s): []")
                 return files_with_selector
             
             # Step 2: Extract all imports from test file (with recursion for nested imports)
             all_imports = self._extract_all_imports_from_test(test_file)
-            logger.debug(f"[BACKWARD SEARCH] Test file imports {len(all_imports)} files")
+            logger.debug("[BACKWARD SEARCH] Test file imports %s files", len(all_imports))
             
             # Normalize paths for comparison
             test_file_normalized = os.path.normpath(test_file)
             all_imports_normalized = {os.path.normpath(f) for f in all_imports}
-            
+
+            # Index imports by basename so each workspace hit compares path
+            # suffixes against its bucket only, instead of every import.
+            imports_by_basename: Dict[str, List["Tuple[str, List[str]]"]] = {}
+            for imported_file in all_imports:
+                imported_parts = imported_file.replace('\\', '/').split('/')
+                imports_by_basename.setdefault(imported_parts[-1], []).append((imported_file, imported_parts))
+
             # Step 3: Verify which matched files are actually used by the test
             for file_path in workspace_files:
                 file_path_normalized = os.path.normpath(file_path)
-                
+
                 # Check if this is the test file itself
                 if file_path_normalized == test_file_normalized:
-                    logger.debug(f"[BACKWARD SEARCH] ✓ Selector in test file: {file_path}")
+                    logger.debug("[BACKWARD SEARCH] ✓ Selector in test file: %s", file_path)
                     files_with_selector.append(file_path)
                     continue
-                
+
                 # Check if this file is in the imports (direct match)
                 if file_path_normalized in all_imports_normalized:
-                    logger.debug(f"[BACKWARD SEARCH] ✓ Selector in imported file: {file_path}")
+                    logger.debug("[BACKWARD SEARCH] ✓ Selector in imported file: %s", file_path)
                     files_with_selector.append(file_path)
                     continue
-                
+
                 # Check if the file path matches any import by filename
                 # (handles different path separators and relative vs absolute paths)
-                file_name = os.path.basename(file_path)
-                for imported_file in all_imports:
-                    if os.path.basename(imported_file) == file_name:
-                        # Verify it's the same file by checking if paths end the same way
-                        imported_parts = imported_file.replace('\\', '/').split('/')
-                        file_parts = file_path.replace('\\', '/').split('/')
-                        
-                        # Compare the last N parts of the path
-                        min_parts = min(len(imported_parts), len(file_parts))
-                        if imported_parts[-min_parts:] == file_parts[-min_parts:]:
-                            logger.debug(f"[BACKWARD SEARCH] ✓ Selector in imported file: {file_path}")
-                            files_with_selector.append(imported_file)  # Use the full path from imports
-                            break
+                file_parts = file_path.replace('\\', '/').split('/')
+                for imported_file, imported_parts in imports_by_basename.get(file_parts[-1], ()):
+                    # Verify it's the same file by checking if paths end the same way
+                    min_parts = min(len(imported_parts), len(file_parts))
+                    if imported_parts[-min_parts:] == file_parts[-min_parts:]:
+                        logger.debug("[BACKWARD SEARCH] ✓ Selector in imported file: %s", file_path)
+                        files_with_selector.append(imported_file)  # Use the full path from imports
+                        break
                 else:
-                    logger.debug(f"[BACKWARD SEARCH] ✗ Selector in unrelated file: {file_path}")
+                    logger.debug("[BACKWARD SEARCH] ✗ Selector in unrelated file: %s", file_path)
         
         except Exception as e:
-            logger.debug(f"[BACKWARD SEARCH] Error during search: {e}")
+            logger.debug("[BACKWARD SEARCH] Error during search: %s", e)
         
-        logger.info(f"[AUTO-UPDATE] Found selector in {len(files_with_selector)} file(s): {files_with_selector}")
+        logger.info("[AUTO-UPDATE] Found selector in %s file(s): %s", len(files_with_selector), files_with_selector)
         return files_with_selector
     
+    def _ripgrep_search(self, selector_value: str) -> List[str]:
+        """Search the workspace with a local ripgrep binary.
+
+        ripgrep's SIMD literal search and parallel, gitignore-aware directory
+        walk beat the HTTP endpoint's round-trip; returns an empty list when
+        rg is missing or the search fails so callers can fall back.
+        """
+        if not self._rg_path:
+            return []
+        try:
+            proc = subprocess.run(
+                [
+                    self._rg_path,
+                    "--fixed-strings",
+                    "--type=py",
+                    "--json",
+                    "--max-count=50",
+                    "--glob=!__pycache__/*",
+                    "--glob=!*.pyc",
+                    selector_value,
+                ],
+                cwd=self._workspace_root,
+                capture_output=True,
+                timeout=15,
+                text=True,
+            )
+            file_paths: List[str] = []
+            for line in proc.stdout.splitlines():
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if obj.get("type") != "match":
+                    continue
+                path = obj.get("data", {}).get("path", {}).get("text")
+                if not path:
+                    continue
+                full_path = os.path.join(self._workspace_root, path).replace('\\', '/')
+                if full_path not in file_paths:
+                    file_paths.append(full_path)
+            if file_paths:
+                logger.info("[RIPGREP-SEARCH] Found %s file(s) with selector", len(file_paths))
+            return file_paths
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("[RIPGREP-SEARCH] Failed: %s", e)
+            return []
+
     def _workspace_search_for_selector(self, selector_value: str) -> List[str]:
         """Try to find files using workspace search API. Returns empty list if not found or API unavailable."""
+        rg_results = self._ripgrep_search(selector_value)
+        if rg_results:
+            return rg_results
         try:
             # Use dedicated search endpoint (not the unified AI endpoint)
             search_url = f"{self._local_ai_url}/v1/workspace/files/search"
             # Prefer a narrower search first (avoids huge workspaces like venv), then fall back.
-            preferred_pattern = os.environ.get("SELENIUM_WORKSPACE_SEARCH_FILE_PATTERN", "src/**/*.py")
-            patterns_to_try = [preferred_pattern, "**/*.py"]
+            patterns_to_try = [self._workspace_search_pattern, "**/*.py"]
             seen_patterns = set()
 
             for file_pattern in patterns_to_try:
@@ -257,41 +578,46 @@ class CorrectionTracker:
                     "maxResults": 50
                 }
 
-                logger.debug(f"[WORKSPACE-SEARCH-REQUEST] URL: {search_url}")
-                logger.debug(f"[WORKSPACE-SEARCH-REQUEST] Payload: {search_payload}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[WORKSPACE-SEARCH-REQUEST] URL: %s", search_url)
+                    logger.debug("[WORKSPACE-SEARCH-REQUEST] Payload: %s", search_payload)
 
-                response = requests.post(search_url, json=search_payload, timeout=30)
+                response = self._http.post(search_url, json=search_payload, timeout=30)
 
-                logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Status: {response.status_code}")
-                logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Headers: {dict(response.headers)}")
-                logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Body length: {len(response.text)} chars")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[WORKSPACE-SEARCH-RESPONSE] Status: %s", response.status_code)
+                    logger.debug("[WORKSPACE-SEARCH-RESPONSE] Headers: %s", dict(response.headers))
+                    logger.debug("[WORKSPACE-SEARCH-RESPONSE] Body length: %d chars", len(response.text))
 
                 if not response.ok:
-                    logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Body: {response.text[:500]}")
-                    logger.debug(f"[WORKSPACE-SEARCH] Request failed: {response.status_code}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[WORKSPACE-SEARCH-RESPONSE] Body: %s", response.text[:500])
+                        logger.debug("[WORKSPACE-SEARCH] Request failed: %s", response.status_code)
                     continue
 
                 search_results = response.json()
-                logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Parsed JSON keys: {list(search_results.keys())}")
-                logger.debug(f"[WORKSPACE-SEARCH-RESPONSE] Full response: {search_results}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[WORKSPACE-SEARCH-RESPONSE] Parsed JSON keys: %s", list(search_results.keys()))
+                    logger.debug("[WORKSPACE-SEARCH-RESPONSE] Full response: %s", search_results)
 
                 file_paths: List[str] = []
 
                 # Handle dedicated endpoint 'results' markdown format
                 results_text = search_results.get("results", "")
-                logger.debug(f"[WORKSPACE-SEARCH] Results text length: {len(results_text)} chars")
-                logger.debug(f"[WORKSPACE-SEARCH] Results text preview: {results_text[:300]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[WORKSPACE-SEARCH] Results text length: %d chars", len(results_text))
+                    logger.debug("[WORKSPACE-SEARCH] Results text preview: %s", results_text[:300])
 
                 if results_text and "No matches found" not in results_text:
-                    logger.debug(f"[WORKSPACE-SEARCH] Parsing markdown results ({len(results_text)} chars)")
+                    logger.debug("[WORKSPACE-SEARCH] Parsing markdown results (%d chars)", len(results_text))
                     for line in results_text.split('\n'):
                         if line.startswith('## ') and line.endswith('.py'):
                             file_path = line[3:].strip()
                             if '__pycache__' not in file_path and not file_path.endswith('.pyc') and file_path not in file_paths:
                                 file_paths.append(file_path)
-                                logger.debug(f"[WORKSPACE-SEARCH] Added file: {file_path}")
+                                logger.debug("[WORKSPACE-SEARCH] Added file: %s", file_path)
                 else:
-                    logger.debug(f"[WORKSPACE-SEARCH] No results in response")
+                    logger.debug("[WORKSPACE-SEARCH] No results in response")
 
                 if file_paths:
                     logger.info(
@@ -299,13 +625,13 @@ class CorrectionTracker:
                     )
                     return file_paths
 
-                logger.debug(f"[WORKSPACE-SEARCH] No files found (pattern={file_pattern})")
+                logger.debug("[WORKSPACE-SEARCH] No files found (pattern=%s)", file_pattern)
 
             return []
             
         except Exception as e:
-            logger.error(f"[WORKSPACE-SEARCH-ERROR] Failed: {type(e).__name__}: {str(e)}")
-            logger.debug(f"[WORKSPACE-SEARCH-ERROR] Details: {e}", exc_info=True)
+            logger.error("[WORKSPACE-SEARCH-ERROR] Failed: %s: %s", type(e).__name__, str(e))
+            logger.debug("[WORKSPACE-SEARCH-ERROR] Details: %s", e, exc_info=True)
             return []
     
     def _extract_all_imports_from_test(self, test_file: str, max_depth: int = 3, visited: Optional[set] = None) -> List[str]:  # noqa: A006
@@ -335,126 +661,237 @@ class CorrectionTracker:
                         all_imports.extend(nested)
         
         except Exception as e:
-            logger.debug(f"[IMPORT EXTRACTION] Error: {e}")
+            logger.debug("[IMPORT EXTRACTION] Error: %s", e)
         
         return all_imports
     
     def _is_page_object_file(self, file_path: str) -> bool:
         """Check if a file is likely a page object or steps file (not a utility or base class)."""
+        cached = self._page_object_cache.get(file_path)
+        if cached is not None:
+            return cached
+
         file_lower = file_path.lower()
-        
-        # Include: Page objects, Dialogs, Modals, Components, Steps
-        if any(pattern in file_lower for pattern in ['page.py', 'dialog.py', 'modal.py', 'section.py', 'steps.py', 'step.py']):
-            return True
-        
-        # Include: Files in component/header/steps directories
-        if any(pattern in file_lower for pattern in ['component', 'header', 'footer', 'sidebar', '/steps/', '\\steps\\']):
-            return True
-        
-        # Exclude: Utilities, base classes, helpers, drivers, clients
-        if any(pattern in file_lower for pattern in ['utility.py', 'helper.py', 'base.py', 'util.py', '__init__.py', 'driver.py', 'client.py']):
-            return False
-        
-        return False
+        result = any(pattern in file_lower for pattern in _PAGE_OBJECT_PATTERNS)
+        self._page_object_cache[file_path] = result
+        return result
+
+    def _extract_imports_ast(self, test_file: str) -> List[str]:
+        """Extract imported file paths from a local file by walking its AST."""
+        imported_files: List[str] = []
+        try:
+            with open(test_file, 'rb') as f:
+                tree = ast.parse(f.read(), filename=test_file)
+        except (OSError, SyntaxError, ValueError) as e:
+            logger.debug("[IMPORT EXTRACTION] AST parse failed for %s: %s", test_file, e)
+            return imported_files
+
+        seen_modules: set = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                module_path = node.module
+                if module_path in seen_modules:
+                    continue
+                seen_modules.add(module_path)
+                file_path = self._module_to_file_path(module_path, test_file)
+                if file_path:
+                    imported_files.append(file_path)
+        return imported_files
+
+    def _imports_fingerprint(self, test_file: str) -> Optional[str]:
+        """Cheap local fingerprint for the imports cache, or None if unreadable."""
+        try:
+            return f"mtime:{os.stat(test_file).st_mtime_ns}"
+        except OSError:
+            return None
 
     def _extract_imported_files(self, test_file: str) -> List[str]:
-        """Extract imported page object file paths from a test file."""
+        """Extract imported page object file paths from a test file.
+
+        Results are memoized per (file, mtime/content hash) so repeated
+        corrections touching the same files skip the HTTP read and the
+        regex parse once warmed up.
+        """
         imported_files: List[str] = []
-        
+
+        fingerprint = self._imports_fingerprint(test_file)
+        cached = self._imports_cache.get(test_file)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return list(cached[1])
+
+        # Local files skip the HTTP read entirely: one C-implemented ast
+        # parse replaces the round-trip and the regex sweep.
+        if os.path.isfile(test_file):
+            imported_files = self._extract_imports_ast(test_file)
+            if fingerprint is not None:
+                self._imports_cache[test_file] = (fingerprint, list(imported_files))
+            return imported_files
+
         try:
             # Read the test file content via dedicated endpoint
             read_url = f"{self._local_ai_url}/v1/workspace/files/read"
             read_payload = {"filePath": test_file}
             
-            logger.debug(f"[FILE-READ-REQUEST] URL: {read_url}")
-            logger.debug(f"[FILE-READ-REQUEST] Payload: {read_payload}")
-            
-            read_response = requests.post(read_url, json=read_payload, timeout=30)
-            
-            logger.debug(f"[FILE-READ-RESPONSE] Status: {read_response.status_code}")
-            logger.debug(f"[FILE-READ-RESPONSE] Headers: {dict(read_response.headers)}")
-            logger.debug(f"[FILE-READ-RESPONSE] Body length: {len(read_response.text)} chars")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-READ-REQUEST] URL: %s", read_url)
+                logger.debug("[FILE-READ-REQUEST] Payload: %s", read_payload)
+
+            read_response = self._http.post(read_url, json=read_payload, timeout=30)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-READ-RESPONSE] Status: %s", read_response.status_code)
+                logger.debug("[FILE-READ-RESPONSE] Headers: %s", dict(read_response.headers))
+                logger.debug("[FILE-READ-RESPONSE] Body length: %d chars", len(read_response.text))
+
             if not read_response.ok:
-                logger.debug(f"[FILE-READ-RESPONSE] Body: {read_response.text[:500]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[FILE-READ-RESPONSE] Body: %s", read_response.text[:500])
                 return imported_files
-            
+
             file_content = read_response.json()
-            logger.debug(f"[FILE-READ-RESPONSE] Parsed JSON keys: {list(file_content.keys())}")
-            logger.debug(f"[FILE-READ-RESPONSE] Full response: {file_content}")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-READ-RESPONSE] Parsed JSON keys: %s", list(file_content.keys()))
+                logger.debug("[FILE-READ-RESPONSE] Full response: %s", file_content)
+
             if not file_content.get("success"):
-                logger.debug(f"[FILE-READ] Read failed: success={file_content.get('success')}")
+                logger.debug("[FILE-READ] Read failed: success=%s", file_content.get('success'))
                 return imported_files
-            
+
             content = file_content.get("content", "")
-            logger.debug(f"[FILE-READ] Content length: {len(content)} chars")
-            
-            # Pattern to match imports - configurable via SELENIUM_IMPORT_PATTERN env var
-            for match in re.finditer(self._import_pattern, content):
+            logger.debug("[FILE-READ] Content length: %d chars", len(content))
+
+            # Without a local mtime, fall back to fingerprinting the fetched
+            # content so an unchanged file still skips the regex parse.
+            if fingerprint is None:
+                fingerprint = f"sha1:{hashlib.sha1(content.encode('utf-8')).hexdigest()}"
+            if cached is not None and cached[0] == fingerprint:
+                return list(cached[1])
+
+            # Imports live in the header block before the first def/class,
+            # so scan only that slice; files with neither keyword fall back
+            # to the full content.
+            def_pos = content.find('\ndef ')
+            class_pos = content.find('\nclass ')
+            cutoff = min(pos for pos in (def_pos, class_pos, len(content)) if pos != -1)
+            header = content[:cutoff]
+
+            # Single fused pass: the configurable import pattern and the
+            # keyword-filtered step/page-object imports are checked against
+            # the same match, halving the content scanned by the regex engine.
+            seen_modules: set = set()
+            for match in self._combined_import_re.finditer(header):
                 module_path = match.group(1)
-                # Convert module path to file path
+                if module_path in seen_modules:
+                    continue
+                seen_modules.add(module_path)
+                if not (self._import_re.match(match.group(0))
+                        or any(keyword in module_path for keyword in self._import_keywords)):
+                    continue
                 file_path = self._module_to_file_path(module_path, test_file)
                 if file_path:
                     imported_files.append(file_path)
-            
-            # Also extract from imports in step functions and page objects
-            # Pattern: from <path> import <class>
-            step_import_pattern = r'from\s+([\w.]+)\s+import\s+([\w,\s]+)'
-            for match in re.finditer(step_import_pattern, content):
-                module_path = match.group(1)
-                # Include Page classes and step files (configurable via environment variable)
-                keywords = os.environ.get("SELENIUM_IMPORT_KEYWORDS", "Page,.steps.,steps").split(",")
-                if any(keyword.strip() in module_path for keyword in keywords):
-                    file_path = self._module_to_file_path(module_path, test_file)
-                    if file_path:
-                        imported_files.append(file_path)
-        
+
+            self._imports_cache[test_file] = (fingerprint, list(imported_files))
+
         except Exception as e:
-            logger.debug(f"[IMPORT EXTRACTION] Error: {e}")
-        
+            logger.debug("[IMPORT EXTRACTION] Error: %s", e)
+
         return imported_files
 
     def _module_to_file_path(self, module_path: str, reference_file: str) -> Optional[str]:
-        """Convert a Python module path to a file path."""
+        """Convert a Python module path to a file path.
+
+        Both the package-root discovery walk and the final resolution are
+        cached, so repeated imports cost a dict lookup instead of a chain of
+        filesystem stats.
+        """
         try:
             # Extract the root package name from module_path
             parts = module_path.split('.')
             if not parts:
                 return None
-            
+
             root_package = parts[0]
-            ref_path = Path(reference_file)
-            
-            # Find the root package directory by going up from the reference file
-            current = ref_path.parent
-            package_root = None
-            
-            while current.parent != current:
-                if (current / root_package).exists():
-                    package_root = current / root_package
-                    break
-                current = current.parent
-            
+            ref_dir = str(Path(reference_file).parent)
+
+            root_key = (ref_dir, root_package)
+            if root_key in self._package_root_cache:
+                package_root = self._package_root_cache[root_key]
+            else:
+                # Find the root package directory by going up from the reference file
+                package_root = None
+                current = Path(ref_dir)
+                while current.parent != current:
+                    if (current / root_package).exists():
+                        package_root = current / root_package
+                        break
+                    current = current.parent
+                self._package_root_cache[root_key] = package_root
+
             if not package_root:
                 return None
-            
+
+            module_key = (module_path, str(package_root))
+            if module_key in self._module_path_cache:
+                return self._module_path_cache[module_key]
+
             # Convert module path to relative path, removing the root package
             relative_parts = parts[1:]  # Remove root package prefix
             if not relative_parts:
                 return None
-            
+
             relative_path = Path(*relative_parts)
             file_path = package_root / relative_path.with_suffix('.py')
-            
-            if file_path.exists():
-                return str(file_path).replace('\\', '/')
-            
+
+            resolved = str(file_path).replace('\\', '/') if file_path.exists() else None
+            self._module_path_cache[module_key] = resolved
+            return resolved
+
         except Exception as e:
-            logger.debug(f"[MODULE CONVERSION] Error converting {module_path}: {e}")
-        
+            logger.debug("[MODULE CONVERSION] Error converting %s: %s", module_path, e)
+
         return None
 
+    def _apply_edit_via_service(
+        self,
+        file_path: str,
+        original_by: str,
+        original_value: str,
+        corrected_by: str,
+        corrected_value: str
+    ) -> Optional[Dict[str, Any]]:
+        """Try the atomic apply endpoint, which resolves the edit server-side.
+
+        One round-trip instead of read+edit. Returns None when the endpoint
+        is unsupported or the call fails, so callers fall back.
+        """
+        if self._supports_apply is False:
+            return None
+        try:
+            apply_url = f"{self._local_ai_url}/v1/workspace/files/apply"
+            apply_payload = {
+                "filePath": file_path,
+                "matchers": [{
+                    "oldByToken": _strategy_to_by_token(original_by),
+                    "newByToken": _strategy_to_by_token(corrected_by),
+                    "oldValue": original_value,
+                    "newValue": corrected_value,
+                }],
+            }
+            response = self._http.post(apply_url, json=apply_payload, timeout=30)
+            if response.status_code in (404, 405):
+                logger.debug("[FILE-APPLY] Apply endpoint unsupported; using read+edit")
+                self._supports_apply = False
+                return None
+            response.raise_for_status()
+            self._supports_apply = True
+            result: Dict[str, Any] = response.json()
+            logger.info("[FILE-APPLY] File update result: success=%s", result.get('success'))
+            return result
+        except Exception as e:
+            logger.debug("[FILE-APPLY] Failed, falling back to read+edit: %s", e)
+            return None
+
     def update_test_file_via_service(
         self,
         file_path: str,
@@ -463,48 +900,74 @@ class CorrectionTracker:
         corrected_by: str,
         corrected_value: str
     ) -> Dict[str, Any]:
+        """Apply one correction, memoized per (file, mtime, correction).
+
+        Duplicate corrections — common when several tests hit the same
+        broken selector — skip the re-read and re-parse; an edit to the
+        file changes its mtime and busts the entry automatically.
+        """
+        fingerprint = self._imports_fingerprint(file_path)
+        if fingerprint is None:
+            return self._update_test_file_uncached(
+                file_path, original_by, original_value, corrected_by, corrected_value
+            )
+
+        cache_key = (file_path, fingerprint, original_by, original_value, corrected_by, corrected_value)
+        cached = self._update_result_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[FILE-EDIT] Duplicate correction served from cache for %s", file_path)
+            return dict(cached)
+
+        result = self._update_test_file_uncached(
+            file_path, original_by, original_value, corrected_by, corrected_value
+        )
+        if len(self._update_result_cache) >= 1024:
+            self._update_result_cache.pop(next(iter(self._update_result_cache)))
+        self._update_result_cache[cache_key] = dict(result)
+        return result
+
+    def _update_test_file_uncached(
+        self,
+        file_path: str,
+        original_by: str,
+        original_value: str,
+        corrected_by: str,
+        corrected_value: str
+    ) -> Dict[str, Any]:
+        applied = self._apply_edit_via_service(
+            file_path, original_by, original_value, corrected_by, corrected_value
+        )
+        if applied is not None:
+            return applied
+
         try:
             # Read the file using dedicated endpoint
             read_url = f"{self._local_ai_url}/v1/workspace/files/read"
             read_payload = {"filePath": file_path}
             
-            logger.debug(f"[FILE-EDIT-READ-REQUEST] URL: {read_url}")
-            logger.debug(f"[FILE-EDIT-READ-REQUEST] Payload: {read_payload}")
-            
-            read_response = requests.post(read_url, json=read_payload, timeout=30)
-            
-            logger.debug(f"[FILE-EDIT-READ-RESPONSE] Status: {read_response.status_code}")
-            logger.debug(f"[FILE-EDIT-READ-RESPONSE] Headers: {dict(read_response.headers)}")
-            logger.debug(f"[FILE-EDIT-READ-RESPONSE] Body length: {len(read_response.text)} chars")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-EDIT-READ-REQUEST] URL: %s", read_url)
+                logger.debug("[FILE-EDIT-READ-REQUEST] Payload: %s", read_payload)
+
+            read_response = self._http.post(read_url, json=read_payload, timeout=30)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-EDIT-READ-RESPONSE] Status: %s", read_response.status_code)
+                logger.debug("[FILE-EDIT-READ-RESPONSE] Headers: %s", dict(read_response.headers))
+                logger.debug("[FILE-EDIT-READ-RESPONSE] Body length: %d chars", len(read_response.text))
+
             read_response.raise_for_status()
             file_content = read_response.json()
-            
-            logger.debug(f"[FILE-EDIT-READ-RESPONSE] Parsed JSON keys: {list(file_content.keys())}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-EDIT-READ-RESPONSE] Parsed JSON keys: %s", list(file_content.keys()))
 
             if not file_content.get("success"):
-                logger.error(f"[FILE-EDIT] Read failed: {file_content}")
+                logger.error("[FILE-EDIT] Read failed: %s", file_content)
                 return {"success": False, "errors": ["Could not read file"]}
 
             content = file_content.get("content", "")
-            logger.debug(f"[FILE-EDIT] Read {len(content)} chars from {file_path}")
-
-            def _strategy_to_by_token(strategy: str) -> Optional[str]:
-                s = (strategy or "").strip().lower()
-                mapping = {
-                    "css selector": "CSS_SELECTOR",
-                    "css": "CSS_SELECTOR",
-                    "xpath": "XPATH",
-                    "id": "ID",
-                    "name": "NAME",
-                    "class name": "CLASS_NAME",
-                    "class": "CLASS_NAME",
-                    "tag name": "TAG_NAME",
-                    "tag": "TAG_NAME",
-                    "link text": "LINK_TEXT",
-                    "partial link text": "PARTIAL_LINK_TEXT",
-                }
-                return mapping.get(s)
+            logger.debug("[FILE-EDIT] Read %d chars from %s", len(content), file_path)
 
             corrected_by_token = _strategy_to_by_token(corrected_by)
 
@@ -515,7 +978,7 @@ class CorrectionTracker:
                 # Find all occurrences of the selector value inside a By.<TOKEN>, '<value>' pair.
                 # We intentionally allow any existing By token to be replaced.
                 locator_pattern = re.compile(
-                    r"By\\.[A-Z_]+(\\s*,\\s*)(['\"])" + re.escape(original_value) + r"\\2"
+                    r"By\.[A-Z_]+(\s*,\s*)(['\"])" + re.escape(original_value) + r"\2"
                 )
 
                 for match in locator_pattern.finditer(content):
@@ -527,7 +990,7 @@ class CorrectionTracker:
                         replacements.append({"oldString": old_substring, "newString": new_substring})
 
                 if replacements:
-                    logger.debug(f"[FILE-EDIT] Prepared {len(replacements)} strategy-aware replacement(s)")
+                    logger.debug("[FILE-EDIT] Prepared %d strategy-aware replacement(s)", len(replacements))
                 else:
                     logger.debug("[FILE-EDIT] No strategy-aware matches found")
             
@@ -548,119 +1011,272 @@ class CorrectionTracker:
                         ],
                     }
 
-                old_patterns = [
-                    f'"{original_value}"',
-                    f"'{original_value}'",
-                ]
-
-                found_pattern = None
-                new_pattern = None
-                for old_pattern in old_patterns:
-                    if old_pattern in content:
-                        found_pattern = old_pattern
-                        logger.debug(f"[FILE-EDIT] Found value-only pattern: {old_pattern[:100]}")
-
-                        # Choose quote style based on what's in the corrected value
-                        if "'" in corrected_value and '"' not in corrected_value:
-                            new_pattern = f'"{corrected_value}"'
-                        elif '"' in corrected_value and "'" not in corrected_value:
-                            new_pattern = f"'{corrected_value}'"
-                        elif "'" in corrected_value and '"' in corrected_value:
-                            if old_pattern.startswith('"'):
-                                escaped_value = corrected_value.replace('"', '\\"')
-                                new_pattern = f'"{escaped_value}"'
-                            else:
-                                escaped_value = corrected_value.replace("'", "\\'")
-                                new_pattern = f"'{escaped_value}'"
-                        else:
-                            new_pattern = f'"{corrected_value}"' if old_pattern.startswith('"') else f"'{corrected_value}'"
+                # Do the substitution client-side: one regex pass over content
+                # we already hold covers both quote styles and every
+                # occurrence at once, and the service only has to write the
+                # finished file instead of searching for match positions.
+                value_rx = re.compile(r"(['\"])" + re.escape(original_value) + r"\1")
 
-                        break
+                def _requote(match: "re.Match[str]") -> str:
+                    quote = match.group(1)
+                    return quote + corrected_value.replace(quote, f"\\{quote}") + quote
 
-                if not found_pattern or new_pattern is None:
-                    logger.warning(f"[FILE-EDIT] Could not find selector: {original_value[:50]}")
+                new_content, replaced = value_rx.subn(_requote, content)
+                if not replaced:
+                    logger.warning("[FILE-EDIT] Could not find selector: %s", original_value[:50])
                     return {"success": False, "errors": [f"Could not find selector: {original_value[:50]}..."]}
 
-                replacements = [{"oldString": found_pattern, "newString": new_pattern}]
+                logger.debug("[FILE-EDIT] Replaced %d value-only occurrence(s) client-side", replaced)
+                return self._write_file_via_service(file_path, new_content)
 
             # Use dedicated endpoint for edit (supports multiple replacements)
             edit_url = f"{self._local_ai_url}/v1/workspace/files/edit"
             edit_payload = {"filePath": file_path, "replacements": replacements}
             
-            logger.debug(f"[FILE-EDIT-REQUEST] URL: {edit_url}")
-            logger.debug(f"[FILE-EDIT-REQUEST] Payload: {edit_payload}")
-            
-            edit_response = requests.post(edit_url, json=edit_payload, timeout=30)
-            
-            logger.debug(f"[FILE-EDIT-RESPONSE] Status: {edit_response.status_code}")
-            logger.debug(f"[FILE-EDIT-RESPONSE] Headers: {dict(edit_response.headers)}")
-            logger.debug(f"[FILE-EDIT-RESPONSE] Body length: {len(edit_response.text)} chars")
-            logger.debug(f"[FILE-EDIT-RESPONSE] Body: {edit_response.text[:1000]}")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-EDIT-REQUEST] URL: %s", edit_url)
+                logger.debug("[FILE-EDIT-REQUEST] Payload: %s", edit_payload)
+
+            edit_response = self._http.post(edit_url, json=edit_payload, timeout=30)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FILE-EDIT-RESPONSE] Status: %s", edit_response.status_code)
+                logger.debug("[FILE-EDIT-RESPONSE] Headers: %s", dict(edit_response.headers))
+                logger.debug("[FILE-EDIT-RESPONSE] Body length: %d chars", len(edit_response.text))
+                logger.debug("[FILE-EDIT-RESPONSE] Body: %s", edit_response.text[:1000])
+
             edit_response.raise_for_status()
             result: Dict[str, Any] = edit_response.json()
-            
-            logger.debug(f"[FILE-EDIT-RESPONSE] Parsed JSON: {result}")
-            logger.info(f"[FILE-EDIT] File update result: success={result.get('success')}")
+
+            logger.debug("[FILE-EDIT-RESPONSE] Parsed JSON: %s", result)
+            logger.info("[FILE-EDIT] File update result: success=%s", result.get('success'))
             return result
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"[FILE-EDIT-ERROR] Connection failed: {e}")
-            logger.warning(f"[LOCAL AI SERVICE] Not available at {self._local_ai_url}")
+            logger.error("[FILE-EDIT-ERROR] Connection failed: %s", e)
+            logger.warning("[LOCAL AI SERVICE] Not available at %s", self._local_ai_url)
             return {"success": False, "errors": ["Local AI service not available"]}
         except Exception as e:
-            logger.error(f"[FILE-EDIT-ERROR] {type(e).__name__}: {str(e)}")
-            logger.debug(f"[FILE-EDIT-ERROR] Details: {e}", exc_info=True)
+            logger.error("[FILE-EDIT-ERROR] %s: %s", type(e).__name__, str(e))
+            logger.debug("[FILE-EDIT-ERROR] Details: %s", e, exc_info=True)
             return {"success": False, "errors": [str(e)]}
 
-    def export_corrections_report(self, output_file: str = "selector_corrections.json") -> None:
-        with open(output_file, "w") as f:
-            json.dump({
-                "corrections": self._corrections,
-                "summary": {
-                    "total": len(self._corrections),
-                    "successful": len(self.get_successful_corrections()),
-                    "generated_at": datetime.now().isoformat()
-                }
-            }, f, indent=2)
-        logger.info(f"[CORRECTIONS REPORT] Exported to {output_file}")
+    def _read_file_via_service(self, file_path: str) -> Optional[str]:
+        """Read a file's content through the service, or None on failure."""
+        read_url = f"{self._local_ai_url}/v1/workspace/files/read"
+        try:
+            read_response = self._http.post(read_url, json={"filePath": file_path}, timeout=30)
+            read_response.raise_for_status()
+            file_content = read_response.json()
+        except Exception as e:
+            logger.error("[FILE-READ-ERROR] %s: %s", type(e).__name__, str(e))
+            return None
+        if not file_content.get("success"):
+            logger.error("[FILE-READ] Read failed: %s", file_content)
+            return None
+        content: str = file_content.get("content", "")
+        return content
 
-    def apply_all_corrections_to_files(self) -> ApplyCorrectionsResult:
-        results: ApplyCorrectionsResult = {"total": 0, "success": 0, "failed": 0, "details": []}
-        for correction in self.get_successful_corrections():
-            test_file = correction.get("test_file")
-            if not test_file:
-                continue
-            results["total"] += 1
-            result = self.update_test_file_via_service(
-                test_file,
+    def _substitute_correction(
+        self,
+        content: str,
+        original_by: str,
+        original_value: str,
+        corrected_by: str,
+        corrected_value: str
+    ) -> "Tuple[str, Dict[str, Any]]":
+        """Apply one correction to in-memory content.
+
+        Same replacement rules as update_test_file_via_service, but purely
+        client-side: strategy-aware locator rewrite first, value-only
+        fallback only when the strategy is unchanged. Returns the (possibly
+        unchanged) content and a per-edit result dict.
+        """
+        corrected_by_token = _strategy_to_by_token(corrected_by)
+
+        if corrected_by_token:
+            locator_pattern = re.compile(
+                r"By\.[A-Z_]+(\s*,\s*)(['\"])" + re.escape(original_value) + r"\2"
+            )
+
+            def _relocate(match: "re.Match[str]") -> str:
+                quote = match.group(2)
+                escaped = corrected_value.replace(quote, f"\\{quote}")
+                return f"By.{corrected_by_token}{match.group(1)}{quote}{escaped}{quote}"
+
+            new_content, replaced = locator_pattern.subn(_relocate, content)
+            if replaced:
+                return new_content, {"success": True, "replacements": replaced}
+
+        corrected_by_normalized = (corrected_by or "").strip().lower()
+        original_by_normalized = (original_by or "").strip().lower()
+        if corrected_by_token and corrected_by_normalized != original_by_normalized:
+            return content, {
+                "success": False,
+                "errors": [
+                    "Strategy changed (e.g. xpath -> id) but locator tuple not found in file; skipping unsafe edit"
+                ],
+            }
+
+        value_rx = re.compile(r"(['\"])" + re.escape(original_value) + r"\1")
+
+        def _requote(match: "re.Match[str]") -> str:
+            quote = match.group(1)
+            return quote + corrected_value.replace(quote, f"\\{quote}") + quote
+
+        new_content, replaced = value_rx.subn(_requote, content)
+        if not replaced:
+            return content, {"success": False, "errors": [f"Could not find selector: {original_value[:50]}..."]}
+        return new_content, {"success": True, "replacements": replaced}
+
+    def update_test_file_via_service_batch(
+        self, file_path: str, corrections: List[CorrectionRecord]
+    ) -> List[Dict[str, Any]]:
+        """Apply several corrections to one file with a single read and write.
+
+        Returns one result dict per correction, in order. If the final write
+        fails, every edit that had applied is reported as failed.
+        """
+        content = self._read_file_via_service(file_path)
+        if content is None:
+            return [{"success": False, "errors": ["Could not read file"]} for _ in corrections]
+
+        edit_results: List[Dict[str, Any]] = []
+        changed = False
+        for correction in corrections:
+            content, result = self._substitute_correction(
+                content,
                 correction["original_by"],
                 correction["original_value"],
                 correction["corrected_by"],
-                correction["corrected_value"]
+                correction["corrected_value"],
             )
             if result.get("success"):
-                results["success"] += 1
+                changed = True
+            edit_results.append(result)
+
+        if changed:
+            try:
+                write_result = self._write_file_via_service(file_path, content)
+            except Exception as e:
+                write_result = {"success": False, "errors": [str(e)]}
+            if not write_result.get("success"):
+                errors = write_result.get("errors", ["Write failed"])
+                for result in edit_results:
+                    if result.get("success"):
+                        result["success"] = False
+                        result["errors"] = list(errors)
+        return edit_results
+
+    def _write_file_via_service(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Write fully substituted content back through the service."""
+        write_url = f"{self._local_ai_url}/v1/workspace/files/write"
+        write_payload = {"filePath": file_path, "content": content}
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[FILE-WRITE-REQUEST] URL: %s", write_url)
+            logger.debug("[FILE-WRITE-REQUEST] Content length: %d chars", len(content))
+
+        write_response = self._http.post(write_url, json=write_payload, timeout=30)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[FILE-WRITE-RESPONSE] Status: %s", write_response.status_code)
+            logger.debug("[FILE-WRITE-RESPONSE] Body: %s", write_response.text[:1000])
+
+        write_response.raise_for_status()
+        result: Dict[str, Any] = write_response.json()
+        logger.info("[FILE-WRITE] File update result: success=%s", result.get('success'))
+        return result
+
+    def export_corrections_report(self, output_file: str = "selector_corrections.json") -> None:
+        """Export the corrections report without blocking the caller.
+
+        A snapshot of the records is taken synchronously (so later
+        mutations can't race the write), then the disk I/O drains on the
+        background writer thread; atexit joins it before interpreter
+        exit, so the file is complete by the time the run ends.
+        """
+        snapshot = list(self._corrections)
+        summary = {
+            "total": len(snapshot),
+            "successful": len(self._successful),
+            "generated_at": datetime.now().isoformat()
+        }
+        _io_pool.submit(_write_corrections_report, output_file, snapshot, summary)
+
+    def apply_all_corrections_to_files(self) -> ApplyCorrectionsResult:
+        results = ApplyCorrectionsResult()
+
+        # Clean runs are the common case; skip the grouping and logging
+        # entirely when there is nothing to apply.
+        successful = self.get_successful_corrections()
+        if not successful:
+            return results
+
+        # Group by file so a file with several fixes is read and written
+        # once instead of once per correction. record_correction always sets
+        # test_file (possibly None), so index it directly; hoist the
+        # columnar append out of the per-correction loop.
+        by_file: Dict[str, List[CorrectionRecord]] = {}
+        for correction in successful:
+            test_file = correction["test_file"]
+            if not test_file:
+                continue
+            by_file.setdefault(test_file, []).append(correction)
+
+        # Every grouped correction yields exactly one detail row, so the
+        # columns can be sized once up front.
+        results.presize(sum(len(group) for group in by_file.values()))
+        add_detail = results.add_detail
+
+        for test_file, corrections in by_file.items():
+            if len(corrections) == 1:
+                # Single fix: keep the atomic apply-endpoint fast path.
+                edit_results = [self.update_test_file_via_service(
+                    test_file,
+                    corrections[0]["original_by"],
+                    corrections[0]["original_value"],
+                    corrections[0]["corrected_by"],
+                    corrections[0]["corrected_value"]
+                )]
             else:
-                results["failed"] += 1
-            results["details"].append({
-                "file": test_file,
-                "original": correction["original_value"][:50],
-                "corrected": correction["corrected_value"][:50],
-                "result": result
-            })
-        logger.info(f"[APPLIED CORRECTIONS] {results['success']}/{results['total']} successful")
+                edit_results = self.update_test_file_via_service_batch(test_file, corrections)
+
+            for correction, result in zip(corrections, edit_results):
+                results.total += 1
+                if result.get("success"):
+                    results.success += 1
+                else:
+                    results.failed += 1
+                add_detail(
+                    test_file,
+                    _trunc(correction["original_value"]),
+                    _trunc(correction["corrected_value"]),
+                    result,
+                )
+        logger.info("[APPLIED CORRECTIONS] %s/%s successful", results.success, results.total)
         return results
 
 
 _correction_tracker: Optional[CorrectionTracker] = None
+_tracker_lock = threading.Lock()
 
 
 def get_correction_tracker() -> CorrectionTracker:
-    """Get the global CorrectionTracker instance."""
+    """Get the global CorrectionTracker instance.
+
+    Double-checked locking: the hook can record corrections from several
+    WebDriver threads at once, and racing first calls must not construct
+    two trackers (corrections written to the loser would be dropped). The
+    fast path stays a single global read.
+    """
     global _correction_tracker
-    if _correction_tracker is None:
-        _correction_tracker = CorrectionTracker()
-    return _correction_tracker
+    tracker = _correction_tracker
+    if tracker is None:
+        with _tracker_lock:
+            if _correction_tracker is None:
+                _correction_tracker = CorrectionTracker()
+            tracker = _correction_tracker
+    return tracker
 
 
 def record_correction(
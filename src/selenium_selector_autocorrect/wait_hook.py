@@ -159,6 +159,18 @@ def _create_corrected_method(
         return None
 
 
+class AutoCorrectWebDriverWait(WebDriverWait):
+    """WebDriverWait with selector auto-correction built in.
+
+    Opt-in alternative to install_auto_correct_hook: waits constructed
+    through this class get the correcting until while the global
+    WebDriverWait stays untouched, so plain waits elsewhere in the suite
+    pay no wrapper overhead.
+    """
+
+    until = _patched_until
+
+
 def install_auto_correct_hook() -> None:
     """Install the auto-correct hook into WebDriverWait."""
     WebDriverWait.until = _patched_until  # type: ignore[method-assign,assignment]
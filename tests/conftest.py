@@ -3,7 +3,29 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to path for imports
 src_path = Path(__file__).parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True)
+def _reset_singletons():
+    """Reset module-global singletons between tests.
+
+    The suite runs files on separate xdist workers (--dist=loadfile), but
+    tests within a file still share the process; fresh singletons keep
+    them independent of execution order.
+    """
+    yield
+    from selenium_selector_autocorrect import ai_providers, auto_correct, correction_tracker
+
+    ai_providers._provider_instance = None
+    auto_correct._auto_correct_instance = None
+    # Close before dropping so thread pools and pooled connections are
+    # released immediately instead of lingering for the whole session.
+    if correction_tracker._correction_tracker is not None:
+        correction_tracker._correction_tracker.close()
+    correction_tracker._correction_tracker = None
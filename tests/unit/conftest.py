@@ -0,0 +1,23 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from selenium_selector_autocorrect.correction_tracker import CorrectionTracker
+
+
+@pytest.fixture(scope="module")
+def _tracker_instance():
+    """One CorrectionTracker per test module.
+
+    The constructor builds an HTTP session, a thread pool, and the skip
+    prefix tuple; constructing it once per module keeps that setup out of
+    each test.
+    """
+    return CorrectionTracker()
+
+
+@pytest.fixture
+def fresh_tracker(_tracker_instance):
+    """The shared tracker, cleared after each test."""
+    yield _tracker_instance
+    _tracker_instance.clear_corrections()
@@ -10,41 +10,79 @@ from selenium_selector_autocorrect.correction_tracker import (
 class TestCorrectionTracker:
     """Test CorrectionTracker class."""
 
-    def test_tracker_initialization(self):
-        """CorrectionTracker initializes with empty corrections."""
-        tracker = CorrectionTracker()
-        assert len(tracker.get_corrections()) == 0
+    def test_tracker_initialization(self, fresh_tracker):
+        """CorrectionTracker starts (and resets to) empty corrections."""
+        assert fresh_tracker.correction_count == 0
 
-    def test_record_correction(self):
+    def test_record_correction(self, fresh_tracker):
         """CorrectionTracker records corrections."""
-        tracker = CorrectionTracker()
-        tracker.record_correction(
+        fresh_tracker.record_correction(
             original_by="id",
             original_value="old-id",
             corrected_by="css selector",
             corrected_value=".new-class",
             success=True,
         )
-        corrections = tracker.get_corrections()
+        corrections = fresh_tracker.get_corrections()
         assert len(corrections) == 1
         assert corrections[0]["original_by"] == "id"
         assert corrections[0]["success"] is True
 
-    def test_get_successful_corrections(self):
+    def test_get_successful_corrections(self, fresh_tracker):
         """CorrectionTracker filters successful corrections."""
-        tracker = CorrectionTracker()
-        tracker.record_correction("id", "old", "css", "new", success=True)
-        tracker.record_correction("id", "old2", "css", "new2", success=False)
-        successful = tracker.get_successful_corrections()
+        fresh_tracker.record_correction("id", "old", "css", "new", success=True)
+        fresh_tracker.record_correction("id", "old2", "css", "new2", success=False)
+        successful = fresh_tracker.get_successful_corrections()
         assert len(successful) == 1
         assert successful[0]["success"] is True
 
-    def test_clear_corrections(self):
+    def test_extract_imports_from_local_file(self, fresh_tracker, tmp_path):
+        """Imports in local files are resolved without the workspace service."""
+        package = tmp_path / "pages"
+        package.mkdir()
+        (package / "login_page.py").write_text("LOGIN = ('id', 'login')\n")
+        test_file = tmp_path / "test_login.py"
+        test_file.write_text("from pages.login_page import LOGIN\n")
+        imports = fresh_tracker._extract_imported_files(str(test_file))
+        assert imports == [str(package / "login_page.py")]
+
+    def test_extract_imports_from_remote_file(self, fresh_tracker, tmp_path, monkeypatch):
+        """Consecutive dotted imports all survive the non-AST (service read) path."""
+        package = tmp_path / "pages"
+        package.mkdir()
+        (package / "login_page.py").write_text("LOGIN = ('id', 'login')\n")
+        (package / "home_page.py").write_text("HOME = ('id', 'home')\n")
+        content = (
+            "from pages.login_page import LoginPage\n"
+            "from pages.home_page import HomePage\n"
+        )
+
+        class _StubResponse:
+            ok = True
+            status_code = 200
+            headers: dict = {}
+            text = ""
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"success": True, "content": content}
+
+        monkeypatch.setattr(fresh_tracker._http, "post", lambda *args, **kwargs: _StubResponse())
+        # The file does not exist locally, forcing the service-read path.
+        imports = fresh_tracker._extract_imported_files(str(tmp_path / "test_remote.py"))
+        assert imports == [
+            str(package / "login_page.py"),
+            str(package / "home_page.py"),
+        ]
+
+    def test_clear_corrections(self, fresh_tracker):
         """CorrectionTracker can clear all corrections."""
-        tracker = CorrectionTracker()
-        tracker.record_correction("id", "old", "css", "new")
-        tracker.clear_corrections()
-        assert len(tracker.get_corrections()) == 0
+        fresh_tracker.record_correction("id", "old", "css", "new")
+        assert fresh_tracker.correction_count == 1
+        fresh_tracker.clear_corrections()
+        assert fresh_tracker.correction_count == 0
 
 
 class TestCorrectionTrackerModule:
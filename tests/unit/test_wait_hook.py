@@ -7,16 +7,26 @@ from selenium_selector_autocorrect.wait_hook import install_auto_correct_hook, u
 class TestWaitHook:
     """Test wait_hook functionality."""
 
-    def test_hook_installation(self):
-        """Hook can be installed without errors."""
-        install_auto_correct_hook()
-        # Verify hook is installed by checking WebDriverWait
+    def test_hook_install_uninstall_cycle(self):
+        """One install/uninstall cycle covers both directions."""
         from selenium.webdriver.support.wait import WebDriverWait
-        assert hasattr(WebDriverWait, "until")
 
-    def test_hook_uninstallation(self):
-        """Hook can be uninstalled without errors."""
+        from selenium_selector_autocorrect.wait_hook import _original_until, _patched_until
+
         install_auto_correct_hook()
+        assert WebDriverWait.until is _patched_until
+        uninstall_auto_correct_hook()
+        assert WebDriverWait.until is _original_until
+
+    def test_subclass_wait_leaves_global_until_untouched(self):
+        """AutoCorrectWebDriverWait opts in without patching WebDriverWait."""
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        from selenium_selector_autocorrect.wait_hook import (
+            AutoCorrectWebDriverWait,
+            _patched_until,
+        )
+
         uninstall_auto_correct_hook()
-        # Should not raise any exception
-        assert True
+        assert AutoCorrectWebDriverWait.until is _patched_until
+        assert WebDriverWait.until is not _patched_until